@@ -8,9 +8,11 @@ from datetime import datetime, timedelta
 import numpy as np
 import socket
 import logging
+import math
 import platform
+import threading
 import cpuinfo
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import influxdb_client
 from influxdb_client.client.write_api import SYNCHRONOUS
 import warnings
@@ -25,6 +27,20 @@ warnings.filterwarnings('ignore')
 HISTORY_SIZE = 500
 REFRESH_INTERVALS = [1, 2, 5, 10, 30]
 DEFAULT_INTERFACE = 'eth0'
+RENDER_CACHE_SIZE = 256
+
+# Adaptive sampling and change-based writes
+ADAPTIVE_MAX_INTERVAL = 30
+HEARTBEAT_INTERVAL = 60
+SLEEP_SLICE = 1
+NEXT_SAMPLE_DELAY_KEY = 'next_sample_delay'  # read by tools/loadtest.py for pacing
+INTERFACE_REQUEST_TTL = 2 * ADAPTIVE_MAX_INTERVAL
+WRITE_DEADBANDS = {
+    'cpu': 2.0,                 # percentage points
+    'memory': 1.0,              # percentage points
+    'network_in': 64 * 1024,    # bytes since last write
+    'network_out': 64 * 1024    # bytes since last write
+}
 
 # Initialize logging
 logging.basicConfig(level=logging.INFO)
@@ -58,10 +74,18 @@ class AdvancedNetworkMonitor:
     def get_network_stats(self, interfaces: list):
         """Get statistics for multiple interfaces"""
         stats = []
+        # Host-wide readings, taken once rather than per interface
+        io_counters = psutil.net_io_counters(pernic=True)
+        if_addrs = psutil.net_if_addrs()
+        try:
+            active_connections = len(psutil.net_connections())
+        except Exception as e:
+            logger.error(f"Error getting network connections: {str(e)}")
+            active_connections = 0
         for interface in interfaces:
             try:
-                io = psutil.net_io_counters(pernic=True).get(interface)
-                addrs = psutil.net_if_addrs().get(interface, [])
+                io = io_counters.get(interface)
+                addrs = if_addrs.get(interface, [])
                 ipv4 = next((addr.address for addr in addrs if addr.family == socket.AF_INET), 'N/A')
                 ipv6 = next((addr.address for addr in addrs if addr.family == socket.AF_INET6), 'N/A')
                 mac = next((addr.address for addr in addrs if addr.family == psutil.AF_LINK), 'N/A')
@@ -78,7 +102,7 @@ class AdvancedNetworkMonitor:
                     'ipv4': ipv4,
                     'ipv6': ipv6,
                     'mac': mac,
-                    'active_connections': len(psutil.net_connections())
+                    'active_connections': active_connections
                 }
                 stats.append(stat)
                 self._update_interface_history(interface, stat)
@@ -92,6 +116,113 @@ class AdvancedNetworkMonitor:
             self.interface_stats[interface].pop(0)
         self.interface_stats[interface].append(stat)
 
+def exceeds_deadband(previous: dict, current: dict, deadbands: dict = None) -> bool:
+    """Check whether any field moved outside its deadband"""
+    deadbands = deadbands or WRITE_DEADBANDS
+    if previous is None:
+        return True
+    for key, value in current.items():
+        if key not in previous:
+            return True
+        if abs(value - previous[key]) > deadbands.get(key, 0):
+            return True
+    return False
+
+def cpu_percent_between(previous, current) -> float:
+    """Compute system-wide CPU utilisation between two psutil.cpu_times() readings"""
+    deltas = {
+        field: getattr(current, field) - getattr(previous, field)
+        for field in current._fields
+        # Guest time is already accounted for in user/nice
+        if field not in ('guest', 'guest_nice')
+    }
+    total = sum(deltas.values())
+    if total <= 0:
+        return 0.0
+    idle = deltas.get('idle', 0) + deltas.get('iowait', 0)
+    return round(min(max(100.0 * (total - idle) / total, 0.0), 100.0), 1)
+
+class SharedCollector:
+    """Process-wide collector that samples the host once per tick for all sessions"""
+    def __init__(self):
+        self.network_monitor = AdvancedNetworkMonitor()
+        self.tick_id = 0
+        self.cpu_percent = 0.0
+        self.memory = None
+        self.network_stats = {}
+        self.fields = None
+        self.active = True
+        self._cpu_times = None
+        self._last_sample = None
+        self._requested_interfaces = {}
+        self._lock = threading.Lock()
+        
+    def _sample_cpu(self) -> float:
+        """Get CPU utilisation since the previous tick"""
+        # psutil.cpu_percent(interval=None) keeps its baseline per thread and
+        # every rerun runs in a new script thread, so diff cpu_times() here
+        if self._cpu_times is None:
+            cpu_percent = psutil.cpu_percent(interval=1)
+            self._cpu_times = psutil.cpu_times()
+            return cpu_percent
+        cpu_times = psutil.cpu_times()
+        cpu_percent = cpu_percent_between(self._cpu_times, cpu_times)
+        self._cpu_times = cpu_times
+        return cpu_percent
+        
+    def collect(self, interfaces: list, interval: float) -> dict:
+        """Sample the host at most once per interval and return the current tick
+
+        Only the caller whose request advanced the tick gets advanced=True,
+        so per-tick side effects such as storage writes happen once.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for interface in interfaces:
+                self._requested_interfaces[interface] = now
+            advanced = self._last_sample is None or now - self._last_sample >= interval
+            if advanced:
+                # Only sample interfaces some session asked for recently
+                self._requested_interfaces = {
+                    interface: requested
+                    for interface, requested in self._requested_interfaces.items()
+                    if now - requested <= INTERFACE_REQUEST_TTL
+                }
+                self.cpu_percent = self._sample_cpu()
+                self.memory = psutil.virtual_memory()
+                self.network_stats = {
+                    stat['interface']: stat
+                    for stat in self.network_monitor.get_network_stats(list(self._requested_interfaces))
+                }
+                # Host-wide fields for the stored series, independent of
+                # which interfaces any session has selected
+                net_io = psutil.net_io_counters()
+                fields = {
+                    'cpu': self.cpu_percent,
+                    'memory': self.memory.percent,
+                    'network_in': net_io.bytes_recv,
+                    'network_out': net_io.bytes_sent
+                }
+                self.active = exceeds_deadband(self.fields, fields)
+                self.fields = fields
+                self.tick_id += 1
+                self._last_sample = now
+            return {
+                'tick_id': self.tick_id,
+                'advanced': advanced,
+                'active': self.active,
+                'fields': self.fields,
+                'cpu_percent': self.cpu_percent,
+                'memory': self.memory,
+                'network_stats': [self.network_stats[i] for i in interfaces if i in self.network_stats],
+                'history': {i: list(self.network_monitor.interface_stats[i]) for i in interfaces}
+            }
+
+@st.cache_resource
+def get_collector():
+    """Get the process-wide metrics collector"""
+    return SharedCollector()
+
 class DataStorage:
     def __init__(self):
         influx_url = st.secrets["INFLUXDB"]["URL"]
@@ -121,6 +252,124 @@ class DataStorage:
             record=point
         )
 
+class AdaptiveSampler:
+    def __init__(self, min_interval: float, max_interval: float = ADAPTIVE_MAX_INTERVAL):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+
+    def next_interval(self, active: bool) -> float:
+        """Sample fast while the host is active, back off exponentially when quiet"""
+        if active:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(max(self.interval, self.min_interval) * 2, self.max_interval)
+        return self.interval
+
+class DeadbandWriteFilter:
+    """Change-based write filter for one host series, shared by all sessions"""
+    def __init__(self, deadbands: dict = None, heartbeat_interval: float = HEARTBEAT_INTERVAL):
+        self.deadbands = deadbands or WRITE_DEADBANDS
+        self.heartbeat_interval = heartbeat_interval
+        self.last_written = None
+        self.last_write_time = None
+        self.last_tick_id = None
+        self.pending_heartbeat = False
+        self.samples = 0
+        self.writes = 0
+        self.heartbeats = 0
+        self._lock = threading.Lock()
+
+    def should_write(self, tick_id: int, fields: dict, now: float) -> bool:
+        """Decide whether a tick must be stored, forcing a heartbeat write when due
+
+        Each tick is counted once however many sessions offer it, and a
+        positive decision is recorded immediately so it is written once.
+        """
+        with self._lock:
+            if tick_id == self.last_tick_id:
+                return False
+            self.last_tick_id = tick_id
+            self.samples += 1
+            changed = exceeds_deadband(self.last_written, fields, self.deadbands)
+            heartbeat_due = not changed and now - self.last_write_time >= self.heartbeat_interval
+            if not (changed or heartbeat_due):
+                return False
+            if heartbeat_due:
+                self.heartbeats += 1
+            self.pending_heartbeat = heartbeat_due
+            self.last_written = dict(fields)
+            self.last_write_time = now
+            self.writes += 1
+            return True
+
+    def write_failed(self):
+        """Forget the last recorded write so the next tick is stored again"""
+        with self._lock:
+            self.last_written = None
+            self.writes -= 1
+            if self.pending_heartbeat:
+                self.heartbeats -= 1
+                self.pending_heartbeat = False
+
+    def get_stats(self) -> dict:
+        """Get write reduction statistics"""
+        with self._lock:
+            skipped = self.samples - self.writes
+            return {
+                'samples': self.samples,
+                'writes': self.writes,
+                'skipped': skipped,
+                'heartbeats': self.heartbeats,
+                'reduction_percent': 100.0 * skipped / self.samples if self.samples else 0.0
+            }
+
+@st.cache_resource
+def get_write_filter(host: str):
+    """Get the process-wide write filter for a host's series"""
+    return DeadbandWriteFilter()
+
+class RenderCache:
+    """Size-bounded LRU cache of rendered artifacts shared by all sessions"""
+    def __init__(self, max_size: int = RENDER_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        
+    def get_stats(self) -> dict:
+        """Get cache hit statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate_percent': 100.0 * self.hits / lookups if lookups else 0.0
+            }
+        
+    def get_or_build(self, key: tuple, builder):
+        """Return the artifact stored under key, building it on a miss"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        artifact = builder()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = artifact
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return artifact
+
+@st.cache_resource
+def get_render_cache():
+    """Get the process-wide render cache"""
+    return RenderCache()
+
 def setup_authentication():
     """Set up JWT-based authentication"""
     if 'authenticated' not in st.session_state:
@@ -185,131 +434,179 @@ def format_bytes(size: float) -> str:
         n += 1
     return f"{size:.2f} {units[n]}"
 
-def render_network_metrics(network_monitor, interfaces):
+def build_network_artifacts(stats: list):
+    """Build the traffic figure and summary values for one interface"""
+    df = pd.DataFrame(stats)
+    
+    # Convert bytes to megabytes and calculate rates
+    df['MB_sent'] = df['bytes_sent'] / (1024 * 1024)
+    df['MB_recv'] = df['bytes_recv'] / (1024 * 1024)
+
+    # Calculate data rates (MB/s)
+    df['send_rate'] = df['MB_sent'].diff() / df['timestamp'].diff().dt.total_seconds()
+    df['recv_rate'] = df['MB_recv'].diff() / df['timestamp'].diff().dt.total_seconds()
+
+    # Create two subplots: one for cumulative data, one for rates
+    fig = make_subplots(rows=2, cols=1, 
+                      subplot_titles=(f"Cumulative Traffic (MB)", 
+                                    f"Data Rate (MB/s)"),
+                      vertical_spacing=0.15)
+
+    # Cumulative traffic plot
+    fig.add_trace(
+        go.Scatter(x=df['timestamp'], 
+                  y=df['MB_sent'],
+                  name='Data Sent',
+                  fill='tozeroy',
+                  line=dict(color='rgba(0, 150, 255, 0.8)')),
+        row=1, col=1
+    )
+
+    fig.add_trace(
+        go.Scatter(x=df['timestamp'], 
+                  y=df['MB_recv'],
+                  name='Data Received',
+                  fill='tozeroy',
+                  line=dict(color='rgba(255, 102, 0, 0.8)')),
+        row=1, col=1
+    )
+
+    # Data rate plot
+    fig.add_trace(
+        go.Scatter(x=df['timestamp'],
+                  y=df['send_rate'],
+                  name='Send Rate',
+                  line=dict(color='rgba(0, 150, 255, 0.8)')),
+        row=2, col=1
+    )
+
+    fig.add_trace(
+        go.Scatter(x=df['timestamp'],
+                  y=df['recv_rate'],
+                  name='Receive Rate',
+                  line=dict(color='rgba(255, 102, 0, 0.8)')),
+        row=2, col=1
+    )
+
+    # Update layout for better visualization
+    fig.update_layout(
+        height=700,
+        showlegend=True,
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="left",
+            x=0.01
+        ),
+        hovermode='x unified',
+        margin=dict(l=20, r=20, t=60, b=20)
+    )
+
+    # Update axes labels and styling
+    fig.update_xaxes(title_text="Time", row=2, col=1)
+    fig.update_xaxes(showticklabels=True, row=1, col=1)
+    fig.update_yaxes(title_text="MB", row=1, col=1)
+    fig.update_yaxes(title_text="MB/s", row=2, col=1)
+
+    # Add hover template
+    fig.update_traces(
+        hovertemplate="<b>Time</b>: %{x}<br>" +
+                    "<b>Value</b>: %{y:.2f}<br>"
+    )
+
+    return {
+        'figure': fig,
+        'sent': (f"{df['MB_sent'].iloc[-1]:.2f} MB", f"{df['send_rate'].iloc[-1]:.2f} MB/s"),
+        'recv': (f"{df['MB_recv'].iloc[-1]:.2f} MB", f"{df['recv_rate'].iloc[-1]:.2f} MB/s")
+    }
+
+def build_gauge_figure(title: str, value: float):
+    """Build a 0-100% gauge figure"""
+    return go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=value,
+        title={'text': title},
+        gauge={'axis': {'range': [0, 100]}}
+    ))
+
+def render_network_metrics(tick_id: int, history: dict, interfaces):
     """Render enhanced network metrics visualization with data rates"""
     st.subheader("Network Metrics")
+    render_cache = get_render_cache()
     
     for interface in interfaces:
-        stats = network_monitor.interface_stats[interface]
+        stats = history.get(interface)
         if stats:
             with st.expander(f"Interface: {interface}", expanded=True):
-                df = pd.DataFrame(stats)
-                
-                # Convert bytes to megabytes and calculate rates
-                df['MB_sent'] = df['bytes_sent'] / (1024 * 1024)
-                df['MB_recv'] = df['bytes_recv'] / (1024 * 1024)
-                
-                # Calculate data rates (MB/s)
-                df['send_rate'] = df['MB_sent'].diff() / df['timestamp'].diff().dt.total_seconds()
-                df['recv_rate'] = df['MB_recv'].diff() / df['timestamp'].diff().dt.total_seconds()
-                
-                # Create two subplots: one for cumulative data, one for rates
-                fig = make_subplots(rows=2, cols=1, 
-                                  subplot_titles=(f"Cumulative Traffic (MB)", 
-                                                f"Data Rate (MB/s)"),
-                                  vertical_spacing=0.15)
-                
-                # Cumulative traffic plot
-                fig.add_trace(
-                    go.Scatter(x=df['timestamp'], 
-                              y=df['MB_sent'],
-                              name='Data Sent',
-                              fill='tozeroy',
-                              line=dict(color='rgba(0, 150, 255, 0.8)')),
-                    row=1, col=1
-                )
-                
-                fig.add_trace(
-                    go.Scatter(x=df['timestamp'], 
-                              y=df['MB_recv'],
-                              name='Data Received',
-                              fill='tozeroy',
-                              line=dict(color='rgba(255, 102, 0, 0.8)')),
-                    row=1, col=1
-                )
-                
-                # Data rate plot
-                fig.add_trace(
-                    go.Scatter(x=df['timestamp'],
-                              y=df['send_rate'],
-                              name='Send Rate',
-                              line=dict(color='rgba(0, 150, 255, 0.8)')),
-                    row=2, col=1
-                )
-                
-                fig.add_trace(
-                    go.Scatter(x=df['timestamp'],
-                              y=df['recv_rate'],
-                              name='Receive Rate',
-                              line=dict(color='rgba(255, 102, 0, 0.8)')),
-                    row=2, col=1
-                )
-                
-                # Update layout for better visualization
-                fig.update_layout(
-                    height=700,
-                    showlegend=True,
-                    legend=dict(
-                        yanchor="top",
-                        y=0.99,
-                        xanchor="left",
-                        x=0.01
-                    ),
-                    hovermode='x unified',
-                    margin=dict(l=20, r=20, t=60, b=20)
-                )
-                
-                # Update axes labels and styling
-                fig.update_xaxes(title_text="Time", row=2, col=1)
-                fig.update_xaxes(showticklabels=True, row=1, col=1)
-                fig.update_yaxes(title_text="MB", row=1, col=1)
-                fig.update_yaxes(title_text="MB/s", row=2, col=1)
-                
-                # Add hover template
-                fig.update_traces(
-                    hovertemplate="<b>Time</b>: %{x}<br>" +
-                                "<b>Value</b>: %{y:.2f}<br>"
+                # Every viewer of the same tick reuses one set of artifacts
+                artifacts = render_cache.get_or_build(
+                    ('network', interface, tick_id),
+                    lambda: build_network_artifacts(stats)
                 )
                 
                 # Display current stats
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.metric(
-                        "Total Data Sent",
-                        f"{df['MB_sent'].iloc[-1]:.2f} MB",
-                        f"{df['send_rate'].iloc[-1]:.2f} MB/s"
-                    )
+                    st.metric("Total Data Sent", *artifacts['sent'])
                 with col2:
-                    st.metric(
-                        "Total Data Received",
-                        f"{df['MB_recv'].iloc[-1]:.2f} MB",
-                        f"{df['recv_rate'].iloc[-1]:.2f} MB/s"
-                    )
+                    st.metric("Total Data Received", *artifacts['recv'])
                 
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(artifacts['figure'], use_container_width=True)
 
-def render_system_metrics(system_monitor, memory):
+def render_system_metrics(system_monitor, cpu_percent, memory):
     """Render system metrics visualization"""
     st.subheader("System Metrics")
+    render_cache = get_render_cache()
     col1, col2 = st.columns(2)
     
-    with col1:
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=psutil.cpu_percent(),
-            title={'text': "CPU Usage"},
-            gauge={'axis': {'range': [0, 100]}}
-        ))
-        st.plotly_chart(fig, use_container_width=True)
-        
-    with col2:
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=memory.percent,
-            title={'text': "Memory Usage"},
-            gauge={'axis': {'range': [0, 100]}}
-        ))
-        st.plotly_chart(fig, use_container_width=True)
+    for col, title, value in ((col1, "CPU Usage", cpu_percent),
+                              (col2, "Memory Usage", memory.percent)):
+        value = round(value, 1)
+        with col:
+            fig = render_cache.get_or_build(
+                ('gauge', title, value),
+                lambda: build_gauge_figure(title, value)
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+def render_write_stats(write_filter, sampler):
+    """Render adaptive sampling and write reduction statistics"""
+    stats = write_filter.get_stats()
+    st.sidebar.subheader("Adaptive Sampling")
+    st.sidebar.metric("Sampling Interval", f"{sampler.interval:g} s")
+    st.sidebar.metric(
+        "Host Write Reduction",
+        f"{stats['reduction_percent']:.1f}%",
+        help=f"Across all adaptive sessions, writes to this host's series are skipped "
+             f"while values stay within their deadband; a heartbeat point is written "
+             f"at least every {write_filter.heartbeat_interval} s"
+    )
+    st.sidebar.write(
+        f"Samples: {stats['samples']} | Writes: {stats['writes']} | "
+        f"Skipped: {stats['skipped']} | Heartbeats: {stats['heartbeats']}"
+    )
+
+def render_cache_stats():
+    """Render shared render cache statistics"""
+    stats = get_render_cache().get_stats()
+    st.sidebar.caption(
+        f"Render cache: {stats['hit_rate_percent']:.1f}% hits "
+        f"({stats['hits']} hits, {stats['misses']} misses, {stats['entries']} entries)"
+    )
+
+def wait_for_next_sample(seconds: float):
+    """Sleep in short slices so widget interactions can interrupt the wait"""
+    st.session_state[NEXT_SAMPLE_DELAY_KEY] = seconds
+    countdown = st.empty()
+    deadline = time.monotonic() + seconds
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        # Updating an element lets Streamlit raise a pending widget rerun
+        countdown.caption(f"Next sample in {math.ceil(remaining)} s")
+        time.sleep(min(SLEEP_SLICE, remaining))
+    countdown.empty()
 
 def main():
     # Set up page configuration
@@ -334,7 +631,7 @@ def main():
     
     # Initialize components
     system_monitor = EnhancedSystemMonitor()
-    network_monitor = AdvancedNetworkMonitor()
+    collector = get_collector()
     data_storage = DataStorage()
     
     # Multi-interface selection
@@ -353,31 +650,48 @@ def main():
         col1, col2, col3 = st.columns(3)
         with col1:
             refresh_rate = st.selectbox("Refresh Rate", REFRESH_INTERVALS, index=1)
+            adaptive = st.checkbox(
+                "Adaptive Sampling",
+                value=False,
+                help="Back off while the host is quiet and only store metrics that changed"
+            )
         with col2:
             st.write("## System Overview")
         with col3:
             if st.button("🔄 Force Refresh"):
                 st.rerun()
     
+    # The write filter is shared per host series, sampling pace is per session
+    host = socket.gethostname()
+    write_filter = get_write_filter(host)
+    if 'sampler' not in st.session_state:
+        st.session_state.sampler = AdaptiveSampler(refresh_rate)
+    sampler = st.session_state.sampler
+    sampler.min_interval = refresh_rate
+    
     # Main monitoring loop
     while True:
         try:
-            # Collect metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            network_stats = network_monitor.get_network_stats(selected_interfaces)
+            # Collect metrics, shared with every other session on this tick
+            tick = collector.collect(selected_interfaces, refresh_rate)
+            cpu_percent = tick['cpu_percent']
+            memory = tick['memory']
+            network_stats = tick['network_stats']
             
-            # Store metrics
-            data_storage.write_metrics(
-                measurement="system_metrics",
-                fields={
-                    'cpu': cpu_percent,
-                    'memory': memory.percent,
-                    'network_in': sum(s['bytes_recv'] for s in network_stats),
-                    'network_out': sum(s['bytes_sent'] for s in network_stats)
-                },
-                tags={'host': socket.gethostname()}
-            )
+            # Store metrics; every session sees the tick, only the one that
+            # advanced it stores it
+            if tick['advanced'] and (
+                    not adaptive or write_filter.should_write(tick['tick_id'], tick['fields'], time.time())):
+                try:
+                    data_storage.write_metrics(
+                        measurement="system_metrics",
+                        fields=tick['fields'],
+                        tags={'host': host}
+                    )
+                except Exception:
+                    if adaptive:
+                        write_filter.write_failed()
+                    raise
             
             # Check alerts
             check_alerts({
@@ -388,10 +702,16 @@ def main():
             }, thresholds)
             
             # Visualizations
-            render_network_metrics(network_monitor, selected_interfaces)
-            render_system_metrics(system_monitor, memory)
+            render_network_metrics(tick['tick_id'], tick['history'], selected_interfaces)
+            render_system_metrics(system_monitor, cpu_percent, memory)
+            render_cache_stats()
             
-            time.sleep(refresh_rate)
+            if adaptive:
+                render_write_stats(write_filter, sampler)
+                wait_for_next_sample(sampler.next_interval(tick['active']))
+            else:
+                sampler.interval = refresh_rate
+                wait_for_next_sample(refresh_rate)
             st.rerun()
             
         except Exception as e:
@@ -0,0 +1,470 @@
+"""Headless load test for the dashboard pages.
+
+Drives N simulated sessions of each page with streamlit's AppTest, with
+psutil, cpuinfo and InfluxDB replaced by local stubs, and reports server
+CPU, RSS growth, per-rerun latency percentiles and the InfluxDB write
+rate as N grows.
+
+Each session reruns after the delay its script asked to sleep, so the
+refresh rate and adaptive backoff drive the load. AppTest swaps
+process-wide state while a script runs, so reruns are serialised: lock
+wait is reported apart from run time, and busy % approaching 100 marks
+the point where a single script thread can no longer keep up.
+
+Usage:
+    python tools/loadtest.py --sessions 1 5 10 25 --duration 30
+    python tools/loadtest.py --pages home --adaptive --output loadtest.jsonl
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import re
+import socket
+import sys
+import threading
+import time
+from collections import namedtuple
+from contextlib import ExitStack
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+import psutil
+import cpuinfo
+import influxdb_client
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'app'))
+PAGES = {
+    'home': 'Home.py',
+    'system_details': 'pages/system_details.py',
+    'network_analysis': 'pages/network_analysis.py',
+    'alerts_history': 'pages/alerts_history.py'
+}
+DEFAULT_SESSIONS = [1, 5, 10, 25, 50]
+RERUN_TIMEOUT = 30
+RSS_SAMPLE_INTERVAL = 0.5
+REFRESH_INTERVALS = [1, 2, 5, 10, 30]
+NEXT_SAMPLE_DELAY_KEY = 'next_sample_delay'
+ERROR_PREFIXES = ("Monitoring error",)
+CPU_FIELD = re.compile(r'[ ,]cpu=([-+0-9.eE]+)')
+
+SECRETS = {
+    'INFLUXDB': {
+        'URL': 'http://localhost:8086',
+        'TOKEN': 'loadtest',
+        'ORG': 'loadtest',
+        'BUCKET': 'loadtest'
+    },
+    'ADMIN': {'USER': 'admin', 'PASS': 'loadtest'},
+    'INFLUXDB_URL': 'http://localhost:8086',
+    'INFLUXDB_TOKEN': 'loadtest',
+    'INFLUXDB_ORG': 'loadtest'
+}
+
+_real_sleep = time.sleep
+_process = psutil.Process(os.getpid())
+
+scputimes = namedtuple('scputimes', 'user nice system idle iowait irq softirq steal guest guest_nice')
+svmem = namedtuple('svmem', 'total available percent used free')
+sswap = namedtuple('sswap', 'total used free percent sin sout')
+snetio = namedtuple('snetio', 'bytes_sent bytes_recv packets_sent packets_recv errin errout dropin dropout')
+snicaddr = namedtuple('snicaddr', 'family address netmask broadcast ptp')
+addr = namedtuple('addr', 'ip port')
+sconn = namedtuple('sconn', 'fd family type laddr raddr status pid')
+scpufreq = namedtuple('scpufreq', 'current min max')
+sdiskpart = namedtuple('sdiskpart', 'device mountpoint fstype opts')
+sdiskusage = namedtuple('sdiskusage', 'total used free percent')
+
+class StubPsutil:
+    """Deterministic psutil replacement with slowly varying metrics"""
+    INTERFACES = ['eth0', 'lo']
+    CONNECTIONS = 50
+
+    CPUS = 8
+
+    def __init__(self):
+        self.start = time.monotonic()
+        self._last_cpu_times = {}
+
+    def _elapsed(self):
+        return time.monotonic() - self.start
+
+    def cpu_times(self, percpu=False):
+        # Load follows 40 + 30 * sin(t / 10) percent, integrated over time
+        elapsed = self._elapsed()
+        busy = self.CPUS * (0.4 * elapsed + 3 * (1 - math.cos(elapsed / 10)))
+        user = busy * 0.75
+        system = busy - user
+        return scputimes(user, 0.0, system, self.CPUS * elapsed - busy, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    def _percent_between(self, previous, current):
+        total = sum(current) - sum(previous)
+        if total <= 0:
+            return 0.0
+        return round(100.0 * (1 - (current.idle - previous.idle) / total), 1)
+
+    def cpu_percent(self, interval=None, percpu=False):
+        # Like psutil, interval=None compares against a baseline kept per
+        # thread, and the first call from a thread returns 0.0
+        if interval:
+            previous = self.cpu_times()
+            time.sleep(interval)
+            return self._percent_between(previous, self.cpu_times())
+        thread_id = threading.get_ident()
+        current = self.cpu_times()
+        previous = self._last_cpu_times.get(thread_id)
+        self._last_cpu_times[thread_id] = current
+        if previous is None:
+            return 0.0
+        return self._percent_between(previous, current)
+
+    def virtual_memory(self):
+        total = 16 * 1024**3
+        percent = round(55 + 5 * math.sin(self._elapsed() / 60), 1)
+        used = int(total * percent / 100)
+        return svmem(total, total - used, percent, used, total - used)
+
+    def swap_memory(self):
+        total = 4 * 1024**3
+        return sswap(total, total // 10, total - total // 10, 10.0, 0, 0)
+
+    def net_io_counters(self, pernic=False):
+        elapsed = self._elapsed()
+        counters = {
+            nic: snetio(
+                bytes_sent=int(elapsed * 512 * 1024 * (i + 1)),
+                bytes_recv=int(elapsed * 1024 * 1024 * (i + 1)),
+                packets_sent=int(elapsed * 400),
+                packets_recv=int(elapsed * 800),
+                errin=0, errout=0, dropin=0, dropout=0
+            )
+            for i, nic in enumerate(self.INTERFACES)
+        }
+        if pernic:
+            return counters
+        return snetio(*(sum(values) for values in zip(*counters.values())))
+
+    def net_if_addrs(self):
+        return {
+            nic: [
+                snicaddr(socket.AF_INET, f'10.0.0.{i + 1}', '255.255.255.0', None, None),
+                snicaddr(socket.AF_INET6, f'fe80::{i + 1}', None, None, None),
+                snicaddr(psutil.AF_LINK, f'02:00:00:00:00:0{i + 1}', None, None, None)
+            ]
+            for i, nic in enumerate(self.INTERFACES)
+        }
+
+    def net_connections(self, kind='inet'):
+        return [
+            sconn(-1, socket.AF_INET, socket.SOCK_STREAM,
+                  addr('10.0.0.1', 40000 + i), addr('10.0.1.1', 443),
+                  'ESTABLISHED', 1000 + i)
+            for i in range(self.CONNECTIONS)
+        ]
+
+    def cpu_count(self, logical=True):
+        return 8 if logical else 4
+
+    def cpu_freq(self, percpu=False):
+        return scpufreq(2400.0, 800.0, 3600.0)
+
+    def disk_partitions(self, all=False):
+        return [sdiskpart('/dev/sda1', '/', 'ext4', 'rw')]
+
+    def disk_usage(self, path):
+        total = 512 * 1024**3
+        return sdiskusage(total, total // 2, total // 2, 50.0)
+
+    def patches(self):
+        names = ['cpu_times', 'cpu_percent', 'virtual_memory', 'swap_memory', 'net_io_counters',
+                 'net_if_addrs', 'net_connections', 'cpu_count', 'cpu_freq',
+                 'disk_partitions', 'disk_usage']
+        return [mock.patch.object(psutil, name, getattr(self, name)) for name in names]
+
+class StubInfluxClient:
+    """InfluxDB client replacement that counts writes and keeps written CPU values"""
+    writes = 0
+    cpu_values = []
+    _lock = threading.Lock()
+
+    def __init__(self, url=None, token=None, org=None, **kwargs):
+        self.org = org
+
+    def write_api(self, write_options=None):
+        return self
+
+    def write(self, bucket=None, org=None, record=None, **kwargs):
+        match = CPU_FIELD.search(record.to_line_protocol()) if record is not None else None
+        with StubInfluxClient._lock:
+            StubInfluxClient.writes += 1
+            if match:
+                StubInfluxClient.cpu_values.append(float(match.group(1)))
+
+    def query_api(self):
+        return self
+
+    def query(self, query=None, **kwargs):
+        return []
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls.writes = 0
+            cls.cpu_values = []
+
+class ScriptPacing:
+    """Delay requested by the script run that currently holds the run lock"""
+    requested = None
+
+def stub_sleep(seconds):
+    """End the script run at its refresh wait and record the requested delay"""
+    if os.path.abspath(sys._getframe(1).f_code.co_filename).startswith(APP_DIR + os.sep):
+        if ScriptPacing.requested is None:
+            ScriptPacing.requested = seconds
+        st.stop()
+    _real_sleep(seconds)
+
+def stub_rerun(*args, **kwargs):
+    """End the script run instead of rerunning, the harness paces reruns"""
+    st.stop()
+
+def stubbed_environment():
+    """Patch psutil, cpuinfo, InfluxDB and the scripts' sleep/rerun calls"""
+    stack = ExitStack()
+    for patch in StubPsutil().patches():
+        stack.enter_context(patch)
+    stack.enter_context(mock.patch.object(cpuinfo, 'get_cpu_info', lambda: {
+        'brand_raw': 'Load Test CPU', 'arch': 'X86_64'
+    }))
+    stack.enter_context(mock.patch.object(influxdb_client, 'InfluxDBClient', StubInfluxClient))
+    stack.enter_context(mock.patch.object(time, 'sleep', stub_sleep))
+    stack.enter_context(mock.patch.object(st, 'rerun', stub_rerun))
+    return stack
+
+def create_session(page: str):
+    """Create an authenticated simulated session for a page"""
+    at = AppTest.from_file(os.path.join(APP_DIR, PAGES[page]), default_timeout=RERUN_TIMEOUT)
+    for key, value in SECRETS.items():
+        at.secrets[key] = value
+    at.session_state['authenticated'] = True
+    return at
+
+def requested_delay(at):
+    """Get the delay the last run asked for before its next rerun"""
+    # Home sleeps in slices, so it publishes the full delay in session state
+    if NEXT_SAMPLE_DELAY_KEY in at.session_state:
+        return at.session_state[NEXT_SAMPLE_DELAY_KEY]
+    return ScriptPacing.requested
+
+def has_failed(at) -> bool:
+    """Check a run for uncaught exceptions or errors the page caught and rendered"""
+    if at.exception:
+        return True
+    return any(error.value.startswith(ERROR_PREFIXES) for error in at.error)
+
+def percentile(values: list, q: float):
+    """Get a percentile of durations in seconds, in milliseconds"""
+    return float(np.percentile(np.array(values) * 1000, q)) if values else None
+
+class LoadTest:
+    def __init__(self, page: str, sessions: int, duration: float, refresh: int, adaptive: bool = False):
+        self.page = page
+        self.sessions = sessions
+        self.duration = duration
+        self.refresh = refresh
+        self.adaptive = adaptive
+        self.wait_times = []
+        self.run_times = []
+        self.delays = []
+        self.errors = 0
+        self.peak_rss = 0
+        # AppTest swaps process-wide state (runtime, secrets) while a script
+        # runs, so reruns are serialised. Lock wait and run time are reported
+        # separately; busy_percent near 100 means one script thread is saturated
+        self._run_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._ready = threading.Barrier(sessions + 1)
+
+    def _run(self, at, record: bool = True) -> float:
+        """Run one rerun and return the delay before the session's next rerun"""
+        queued = time.perf_counter()
+        with self._run_lock:
+            started = time.perf_counter()
+            ScriptPacing.requested = None
+            at.run()
+            finished = time.perf_counter()
+            delay = requested_delay(at)
+        if delay is None:
+            delay = self.refresh
+        with self._stats_lock:
+            if has_failed(at):
+                self.errors += 1
+            if record:
+                self.wait_times.append(started - queued)
+                self.run_times.append(finished - started)
+                self.delays.append(delay)
+        return delay
+
+    def _warm_up(self):
+        """Create a session, apply its settings and run it outside the measurement"""
+        at = create_session(self.page)
+        self._run(at, record=False)
+        for selectbox in at.selectbox:
+            if selectbox.label == "Refresh Rate":
+                selectbox.set_value(self.refresh)
+        if self.adaptive:
+            for checkbox in at.checkbox:
+                if checkbox.label == "Adaptive Sampling":
+                    checkbox.check()
+        return at, self._run(at, record=False)
+
+    def _session_worker(self):
+        at = None
+        try:
+            at, delay = self._warm_up()
+        except Exception:
+            with self._stats_lock:
+                self.errors += 1
+        finally:
+            self._ready.wait(timeout=RERUN_TIMEOUT * self.sessions)
+        if at is None:
+            return
+        next_run = time.monotonic() + delay
+        while not self._stop.is_set():
+            self._stop.wait(max(0.0, next_run - time.monotonic()))
+            if self._stop.is_set():
+                break
+            try:
+                next_run = time.monotonic() + self._run(at)
+            except Exception:
+                with self._stats_lock:
+                    self.errors += 1
+                next_run = time.monotonic() + self.refresh
+
+    def _sample_rss(self):
+        while not self._stop.is_set():
+            self.peak_rss = max(self.peak_rss, _process.memory_info().rss)
+            self._stop.wait(RSS_SAMPLE_INTERVAL)
+
+    def run(self) -> dict:
+        """Run all sessions for the configured duration and summarise"""
+        # Start every scenario cold so earlier scenarios do not leak into it
+        st.cache_resource.clear()
+        gc.collect()
+        baseline_rss = _process.memory_info().rss
+
+        workers = [
+            threading.Thread(target=self._session_worker, daemon=True)
+            for _ in range(self.sessions)
+        ]
+        for worker in workers:
+            worker.start()
+        self._ready.wait(timeout=RERUN_TIMEOUT * self.sessions)
+
+        StubInfluxClient.reset()
+        cpu_before = _process.cpu_times()
+        wall_before = time.monotonic()
+        rss_thread = threading.Thread(target=self._sample_rss, daemon=True)
+        rss_thread.start()
+        _real_sleep(self.duration)
+        self._stop.set()
+        writes = StubInfluxClient.writes
+        cpu_values = list(StubInfluxClient.cpu_values)
+        wall = time.monotonic() - wall_before
+        cpu_after = _process.cpu_times()
+        for worker in workers:
+            worker.join(timeout=RERUN_TIMEOUT)
+        rss_thread.join()
+
+        cpu_seconds = (cpu_after.user - cpu_before.user) + (cpu_after.system - cpu_before.system)
+        return {
+            'page': self.page,
+            'sessions': self.sessions,
+            'reruns': len(self.run_times),
+            'reruns_per_s': len(self.run_times) / wall,
+            'mean_interval_s': float(np.mean(self.delays)) if self.delays else None,
+            'errors': self.errors,
+            'run_p50_ms': percentile(self.run_times, 50),
+            'run_p95_ms': percentile(self.run_times, 95),
+            'run_p99_ms': percentile(self.run_times, 99),
+            'wait_p50_ms': percentile(self.wait_times, 50),
+            'wait_p95_ms': percentile(self.wait_times, 95),
+            'busy_percent': 100.0 * sum(self.run_times) / wall,
+            'cpu_percent': 100.0 * cpu_seconds / wall,
+            'baseline_rss_mb': baseline_rss / 1024**2,
+            'rss_growth_mb': max(0, self.peak_rss - baseline_rss) / 1024**2,
+            'influx_writes_per_s': writes / wall,
+            # The stubbed load averages 40%, a mean near zero means the
+            # CPU reading is broken
+            'written_cpu_mean': float(np.mean(cpu_values)) if cpu_values else None
+        }
+
+COLUMNS = [
+    ('page', 'page', '<17', ''),
+    ('sessions', 'sessions', '>9', 'd'),
+    ('reruns/s', 'reruns_per_s', '>9', '.1f'),
+    ('interval s', 'mean_interval_s', '>11', '.1f'),
+    ('run p50', 'run_p50_ms', '>9', '.1f'),
+    ('run p95', 'run_p95_ms', '>9', '.1f'),
+    ('run p99', 'run_p99_ms', '>9', '.1f'),
+    ('wait p50', 'wait_p50_ms', '>9', '.1f'),
+    ('wait p95', 'wait_p95_ms', '>9', '.1f'),
+    ('busy %', 'busy_percent', '>8', '.1f'),
+    ('cpu %', 'cpu_percent', '>8', '.1f'),
+    ('rss +MB', 'rss_growth_mb', '>9', '.1f'),
+    ('writes/s', 'influx_writes_per_s', '>9', '.1f'),
+    ('cpu val', 'written_cpu_mean', '>8', '.1f'),
+    ('errors', 'errors', '>7', 'd')
+]
+HEADER = ''.join(f"{title:{align}}" for title, _, align, _ in COLUMNS)
+
+def format_row(result: dict) -> str:
+    """Format one result as a table row, latencies in milliseconds"""
+    cells = []
+    for _, key, align, spec in COLUMNS:
+        value = result[key]
+        cells.append(f"{'-':{align}}" if value is None else f"{value:{align}{spec}}")
+    return ''.join(cells)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', nargs='+', choices=list(PAGES), default=list(PAGES),
+                        help="Pages to load test")
+    parser.add_argument('--sessions', nargs='+', type=int, default=DEFAULT_SESSIONS,
+                        help="Numbers of concurrent sessions to simulate")
+    parser.add_argument('--duration', type=float, default=30,
+                        help="Seconds to run each scenario")
+    parser.add_argument('--refresh', type=int, choices=REFRESH_INTERVALS, default=1,
+                        help="Refresh rate selected in the pages, and the reload interval "
+                             "of pages without one")
+    parser.add_argument('--adaptive', action='store_true',
+                        help="Enable adaptive sampling on the home page, sessions then "
+                             "rerun at the interval the sampler backs off to")
+    parser.add_argument('--output',
+                        help="Append results as JSON lines to this file to track them over time")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    print(HEADER)
+    with stubbed_environment():
+        for page in args.pages:
+            for sessions in args.sessions:
+                result = LoadTest(page, sessions, args.duration, args.refresh, args.adaptive).run()
+                print(format_row(result), flush=True)
+                if args.output:
+                    with open(args.output, 'a') as f:
+                        f.write(json.dumps({
+                            'timestamp': datetime.now().isoformat(),
+                            'refresh': args.refresh,
+                            'adaptive': args.adaptive,
+                            **result
+                        }) + '\n')
+
+if __name__ == "__main__":
+    main()